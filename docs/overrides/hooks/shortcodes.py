@@ -24,8 +24,11 @@
 from __future__ import annotations
 
 # ## Python StdLib Imports ----
+import os
 import posixpath
 import re
+from functools import lru_cache
+from typing import Callable
 
 # ## Python Third Party Imports ----
 from mkdocs.config.defaults import MkDocsConfig
@@ -38,7 +41,22 @@ from mkdocs.structure.pages import Page
 ## --------------------------------------------------------------------------- #
 
 
-__all__: list[str] = ["on_page_markdown", "flag", "option", "setting"]
+__all__: list[str] = ["on_page_markdown", "render_page", "flag", "option", "setting"]
+
+
+## --------------------------------------------------------------------------- #
+##  Constants                                                               ####
+## --------------------------------------------------------------------------- #
+
+
+# Pages which are short-referenced via the Snippets Notation
+_SHORT_REFERENCED_PAGES: frozenset[str] = frozenset({"overview", "changelog", "contributing"})
+
+# Compiled once at import, rather than on every page render - the snippet regex
+# is anchored to the text following the `8<` scissors, which are located with
+# `str.partition()` instead of scanning the whole page
+_SNIPPET_TAIL_RE: re.Pattern[str] = re.compile(r'-*\s*"([^"]+)"')
+_SHORTCODE_RE: re.Pattern[str] = re.compile(r"<!-- md:(\w+)(.*?) -->", re.I | re.M)
 
 
 ## --------------------------------------------------------------------------- #
@@ -48,72 +66,49 @@ __all__: list[str] = ["on_page_markdown", "flag", "option", "setting"]
 
 # @todo
 def on_page_markdown(markdown: str, *, page: Page, config: MkDocsConfig, files: Files):
+    return render_page(markdown, page, config, files)
+
+
+# Render the shortcodes of a single page. This is a pure function of its inputs:
+# it never mutates `page` or `files`, and the only shared state it touches is
+# read-only lookup tables and `lru_cache` memos, which are thread-safe. Pages
+# can therefore be rendered concurrently, e.g. from a `ThreadPoolExecutor`.
+def render_page(markdown: str, page: Page, config: MkDocsConfig, files: Files):
 
     # There are some pages which are short-referenced, meaning that they
     # are referenced in the main page, but their content is not included in the
     # main page. This is done using the Snippets Notation: https://facelessuser.github.io/pymdown-extensions/extensions/snippets/#snippets-notation
     # In this case, we will read the content of the source file and return it.
-    short_referenced_pages: list[str] = ["overview", "changelog", "contributing"]
-    if page.file.name in short_referenced_pages:
-        pattern = r'-*8<-*\s*"([^"]+)"'
-        match = re.search(pattern, markdown)
+    if page.file.name in _SHORT_REFERENCED_PAGES:
+        _, sep, tail = markdown.partition("8<")
+        match = _SNIPPET_TAIL_RE.match(tail) if sep else None
         if match:
             filename = match.group(1)
-            with open(filename, encoding="utf-8") as f:
-                markdown = f.read()
+            markdown = _read_snippet(filename, os.path.getmtime(filename))
+
+    # Skip the regex scan entirely for pages without any shortcodes - the `md:`
+    # part is matched case-insensitively, so only check for the comment opener
+    if "<!-- " not in markdown:
+        return markdown
 
     # Replace callback
     def replace(match: re.Match):
         type, args = match.groups()
         args = args.strip()
-        if type == "folder":
-            return _badge_for_folder(args, page, files)
-        elif type == "file":
-            return _badge_for_file(args, page, files)
-        elif type == "tag":
-            return _badge_for_tag(args, page, files)
-        elif type == "date":
-            return _badge_for_date(args, page, files)
-        elif type == "link":
-            return _badge_for_link(args, page, files)
-        elif type == "version":
-            if args.startswith("insiders-"):
-                return _badge_for_version_insiders(args, page, files)
-            else:
-                return _badge_for_version(args, page, files)
-        elif type == "sponsors":
-            return _badge_for_sponsors(page, files)
-        elif type == "flag":
-            return flag(args, page, files)
-        elif type == "option":
-            return option(args)
-        elif type == "setting":
-            return setting(args)
-        elif type == "feature":
-            return _badge_for_feature(args, page, files)
-        elif type == "plugin":
-            return _badge_for_plugin(args, page, files)
-        elif type == "extension":
-            return _badge_for_extension(args, page, files)
-        elif type == "utility":
-            return _badge_for_utility(args, page, files)
-        elif type == "example":
-            return _badge_for_example(args, page, files)
-        elif type == "demo":
-            return _badge_for_demo(args, page, files)
-        elif type == "default":
-            if args == "none":
-                return _badge_for_default_none(page, files)
-            elif args == "computed":
-                return _badge_for_default_computed(page, files)
-            else:
-                return _badge_for_default(args, page, files)
-
-        # Otherwise, raise an error
-        raise RuntimeError(f"Unknown shortcode: {type}")
+
+        # Simple badges are rendered straight from their pre-built templates
+        template = _SIMPLE_BADGE_TEMPLATES.get(type)
+        if template is not None and args:
+            return template.format(args)
+
+        # Raise an error for unknown shortcodes
+        handler = _HANDLERS.get(type)
+        if handler is None:
+            raise RuntimeError(f"Unknown shortcode: {type}")
+        return handler(args, page, files)
 
     # Find and replace all external asset URLs in current page
-    return re.sub(r"<!-- md:(\w+)(.*?) -->", replace, markdown, flags=re.I + re.M)
+    return _SHORTCODE_RE.sub(replace, markdown)
 
 
 # ---------------------------------------------------------------------------- #
@@ -146,16 +141,29 @@ def flag(args: str, page: Page, files: Files):
 
 # Create a linkable option
 def option(type: str):
-    _, *_, name = re.split(r"[.:]", type)
+    name = type[max(type.rfind("."), type.rfind(":")) + 1 :]
     return f"[`{name}`](#+{type}){{ #+{type} }}\n\n"
 
 
 # Create a linkable setting - @todo append them to the bottom of the page
 def setting(type: str):
-    _, *_, name = re.split(r"[.*]", type)
+    name = type[max(type.rfind("."), type.rfind("*")) + 1 :]
     return f"`{name}` {{ #{type} }}\n\n[{type}]: #{type}\n\n"
 
 
+## --------------------------------------------------------------------------- #
+##  Reader functions                                                        ####
+## --------------------------------------------------------------------------- #
+
+
+# Read the content of a snippet file - the modification time is part of the
+# cache key, so edits made while running `mkdocs serve` are still picked up
+@lru_cache(maxsize=8)
+def _read_snippet(filename: str, mtime: float):
+    with open(filename, encoding="utf-8") as f:
+        return f.read()
+
+
 ## --------------------------------------------------------------------------- #
 ##  Resolver functions                                                      ####
 ## --------------------------------------------------------------------------- #
@@ -172,21 +180,23 @@ def _resolve_path(path: str, page: Page, files: Files):
 # Resolve path of file relative to given page - the posixpath always includes
 # one additional level of `..` which we need to remove
 def _resolve(file: File, page: Page):
-    path = posixpath.relpath(file.src_uri, page.file.src_uri)
-    return posixpath.sep.join(path.split(posixpath.sep)[1:])
+    return _resolve_uri(file.src_uri, page.file.src_uri)
+
+
+# Resolve source URI relative to page URI - memoized, as most badges resolve the
+# same handful of paths for every page
+@lru_cache(maxsize=512)
+def _resolve_uri(src_uri: str, page_uri: str):
+    path = posixpath.relpath(src_uri, page_uri)
+    return path.partition(posixpath.sep)[2]
 
 
 # Create badge
 def _badge(icon: str, text: str = "", type: str = ""):
     classes = f"mdx-badge mdx-badge--{type}" if type else "mdx-badge"
-    return "".join(
-        [
-            f'<span class="{classes}">',
-            *([f'<span class="mdx-badge__icon">{icon}</span>'] if icon else []),
-            *([f'<span class="mdx-badge__text">{text}</span>'] if text else []),
-            f"</span>",
-        ]
-    )
+    icon_html = f'<span class="mdx-badge__icon">{icon}</span>' if icon else ""
+    text_html = f'<span class="mdx-badge__text">{text}</span>' if text else ""
+    return f'<span class="{classes}">{icon_html}{text_html}</span>'
 
 
 ## --------------------------------------------------------------------------- #
@@ -236,6 +246,13 @@ def _badge_for_sponsors(page: Page, files: Files):
     return _badge(icon=f"[:{icon}:]({href} 'Sponsors only')", type="heart")
 
 
+# Create badge for version - either for regular or Insiders versions
+def _badge_for_version_any(text: str, page: Page, files: Files):
+    if text.startswith("insiders-"):
+        return _badge_for_version_insiders(text, page, files)
+    return _badge_for_version(text, page, files)
+
+
 # Create badge for version
 def _badge_for_version(text: str, page: Page, files: Files):
     spec = text
@@ -327,6 +344,15 @@ def _badge_for_demo(text: str, page: Page, files: Files):
     return _badge(icon=f"[:{icon}:]({href} 'Demo repository')", text=text, type="right")
 
 
+# Create badge for default value - either empty, computed, or explicit
+def _badge_for_default_any(text: str, page: Page, files: Files):
+    if text == "none":
+        return _badge_for_default_none(page, files)
+    elif text == "computed":
+        return _badge_for_default_computed(page, files)
+    return _badge_for_default(text, page, files)
+
+
 # Create badge for default value
 def _badge_for_default(text: str, page: Page, files: Files):
     icon = "material-water"
@@ -381,3 +407,38 @@ def _badge_for_experimental(page: Page, files: Files):
     icon = "material-flask-outline"
     href = _resolve_path("conventions.md#experimental", page, files)
     return _badge(icon=f"[:{icon}:]({href} 'Experimental')")
+
+
+## --------------------------------------------------------------------------- #
+##  Dispatch                                                                ####
+## --------------------------------------------------------------------------- #
+
+
+# Map each shortcode type to its handler - all take `(args, page, files)`
+_HANDLERS: dict[str, Callable[[str, Page, Files], str]] = {
+    "folder": _badge_for_folder,
+    "file": _badge_for_file,
+    "tag": _badge_for_tag,
+    "date": _badge_for_date,
+    "link": _badge_for_link,
+    "version": _badge_for_version_any,
+    "sponsors": lambda args, page, files: _badge_for_sponsors(page, files),
+    "flag": flag,
+    "option": lambda args, page, files: option(args),
+    "setting": lambda args, page, files: setting(args),
+    "feature": _badge_for_feature,
+    "plugin": _badge_for_plugin,
+    "extension": _badge_for_extension,
+    "utility": _badge_for_utility,
+    "example": _badge_for_example,
+    "demo": _badge_for_demo,
+    "default": _badge_for_default_any,
+}
+
+# Pre-built templates for badges which depend only on their text - must match
+# the output of `_badge_for_tag()`, `_badge_for_date()` and `_badge_for_link()`
+_SIMPLE_BADGE_TEMPLATES: dict[str, str] = {
+    "tag": _badge(icon=":label:", text="`{}`"),
+    "date": _badge(icon=":calendar:", text="`{}`"),
+    "link": _badge(icon=":link:", text="{}"),
+}
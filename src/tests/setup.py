@@ -57,11 +57,20 @@ __all__: list[str] = [
     "data_sine",
     "data_line",
     "data_basic",
+    "data_longley",
     "data_noise",
     "BaseTester",
 ]
 
 
+## --------------------------------------------------------------------------- #
+##  Constants                                                               ####
+## --------------------------------------------------------------------------- #
+
+
+ANSI_ESCAPE: re.Pattern[str] = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
+
 ## --------------------------------------------------------------------------- #
 ##  Helper functions                                                        ####
 ## --------------------------------------------------------------------------- #
@@ -69,15 +78,15 @@ __all__: list[str] = [
 
 def name_func_flat_list(
     func: Callable,
-    idx: int,
+    idx: str,
     params: Union[tuple[object, ...], list[object]],
 ) -> str:
-    return f"{func.__name__}_{int(idx)+1:02}_{'_'.join([str(param) for param in params[0]])}"
+    return f"{func.__name__}_{int(idx)+1:02}_{'_'.join(map(str, params[0]))}"
 
 
 def name_func_nested_list(
     func: Callable,
-    idx: int,
+    idx: str,
     params: Union[
         list[Union[tuple[object, ...], list[object]]],
         tuple[Union[tuple[object, ...], list[object]], ...],
@@ -88,7 +97,7 @@ def name_func_nested_list(
 
 def name_func_predefined_name(
     func: Callable,
-    idx: int,
+    idx: str,
     params: Union[tuple[object, ...], list[object]],
 ) -> str:
     return f"{func.__name__}_{int(idx)+1:02}_{params[0][0]}"
@@ -147,8 +156,9 @@ def strip_ansi_codes(text: str) -> str:
         Final Comment:
         - This function enables **environment-agnostic testing** by normalizing the CLI output to plain text that can be consistently checked across local development and CI environments.
     """
-    ansi_escape: re.Pattern[str] = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", text)
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE.sub("", text)
 
 
 clean: Callable[[str], str] = strip_ansi_codes
@@ -170,6 +180,18 @@ def data_basic() -> list[int]:
     return [4, 7, 9, 10, 6, 11, 3]
 
 
+@lru_cache
+def data_longley() -> tuple[pd.Series, pd.DataFrame]:
+    # The Longley dataset, as `(endog, exog)` with a constant added to `exog`.
+    # Imported lazily, so modules which never use it skip `statsmodels.datasets`
+    # ## Python Third Party Imports ----
+    from statsmodels.datasets import longley
+    from statsmodels.tools.tools import add_constant
+
+    data = longley.load_pandas()
+    return data.endog, add_constant(data.exog)
+
+
 # ---------------------------------------------------------------------------- #
 # Classes                                                                   ####
 # ---------------------------------------------------------------------------- #
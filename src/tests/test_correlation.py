@@ -12,8 +12,9 @@
 
 # ## Python Third Party Imports ----
 import numpy as np
+from parameterized import parameterized
 from pytest import raises
-from statsmodels import api as sm
+from statsmodels.regression.linear_model import OLS
 from statsmodels.stats.api import (
     acorr_breusch_godfrey,
     acorr_ljungbox,
@@ -26,7 +27,7 @@ from statsmodels.tsa.stattools import (
 )
 
 # ## Local First Party Imports ----
-from tests.setup import BaseTester
+from tests.setup import BaseTester, data_longley, name_func_predefined_name
 from ts_stat_tests.correlation import (
     acf,
     bglm,
@@ -56,15 +57,20 @@ class TestCorrelation(BaseTester):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
+        cls.data_airline_plus1 = np.asarray(cls.data_airline, dtype=np.float64) + 1.0
         cls.result_acf = acf(cls.data_airline)
         cls.result_pacf = pacf(cls.data_airline)
-        cls.result_ccf = ccf(cls.data_airline, np.array(cls.data_airline) + 1)
+        cls.result_ccf = ccf(cls.data_airline, cls.data_airline_plus1)
         cls.result_alb = lb(cls.data_airline)
         cls.result_alm = lm(cls.data_airline)
-        y = sm.datasets.longley.load_pandas().endog
-        X = sm.datasets.longley.load_pandas().exog
-        X = sm.add_constant(X)
-        cls.result_abg = bglm(sm.OLS(y, X).fit())
+        cls.res_longley = OLS(*data_longley()).fit()
+        cls.result_abg = bglm(cls.res_longley)
+        cls.result_st_acf = st_acf(cls.data_airline)
+        cls.result_st_pacf = st_pacf(cls.data_airline)
+        cls.result_st_ccf = st_ccf(cls.data_airline, cls.data_airline_plus1)
+        cls.result_acorr_ljungbox = acorr_ljungbox(cls.data_airline)
+        cls.result_acorr_lm = acorr_lm(cls.data_airline)
+        cls.result_acorr_breusch_godfrey = acorr_breusch_godfrey(cls.res_longley)
 
     @classmethod
     def tearDownClass(cls) -> None:
@@ -76,43 +82,21 @@ class TestCorrelation(BaseTester):
     def tearDown(self) -> None:
         super().tearDown()
 
-    def test_acf_results(self) -> None:
+    @parameterized.expand(
+        [
+            ("acf", "result_acf", "result_st_acf"),
+            ("pacf", "result_pacf", "result_st_pacf"),
+            ("ccf", "result_ccf", "result_st_ccf"),
+            ("alb", "result_alb", "result_acorr_ljungbox"),
+            ("alm", "result_alm", "result_acorr_lm"),
+            ("abg", "result_abg", "result_acorr_breusch_godfrey"),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_results(self, name: str, result: str, expected: str) -> None:
         np.testing.assert_almost_equal(
-            self.result_acf,
-            st_acf(self.data_airline),
-        )
-
-    def test_pacf_results(self) -> None:
-        np.testing.assert_almost_equal(
-            self.result_pacf,
-            st_pacf(self.data_airline),
-        )
-
-    def test_ccf_results(self) -> None:
-        np.testing.assert_almost_equal(
-            self.result_ccf,
-            st_ccf(self.data_airline, np.array(self.data_airline) + 1),
-        )
-
-    def test_alb_results(self) -> None:
-        np.testing.assert_almost_equal(
-            np.array(self.result_alb),
-            np.array(acorr_ljungbox(self.data_airline)),
-        )
-
-    def test_alm_results(self) -> None:
-        np.testing.assert_almost_equal(
-            self.result_alm,
-            acorr_lm(self.data_airline),
-        )
-
-    def test_abg_results(self) -> None:
-        y = sm.datasets.longley.load_pandas().endog
-        X = sm.datasets.longley.load_pandas().exog
-        X = sm.add_constant(X)
-        np.testing.assert_almost_equal(
-            self.result_abg,
-            acorr_breusch_godfrey(sm.OLS(y, X).fit()),
+            np.array(getattr(self, result)),
+            np.array(getattr(self, expected)),
         )
 
     def test_correlation_acf(self) -> None:
@@ -144,26 +128,14 @@ class TestCorrelation(BaseTester):
             self.result_ccf,
             correlation(
                 x=self.data_airline,
-                y=np.array(self.data_airline) + 1,
+                y=self.data_airline_plus1,
                 algorithm="ccf",
             ),
         )
 
-    def test_correlation_raises(self) -> None:
-        with raises(ValueError):
-            correlation(x=self.data_airline, algorithm="xxxx")
-
-    def test_correlation_ccf_raises(self) -> None:
-        with raises(ValueError):
-            correlation(x=self.data_airline, algorithm="ccf")
-
     def test_correlation_bglm(self) -> None:
-        y = sm.datasets.longley.load_pandas().endog
-        X = sm.datasets.longley.load_pandas().exog
-        X = sm.add_constant(X)
-        res = sm.OLS(y, X).fit()
         np.testing.assert_almost_equal(
-            correlation(res, algorithm="bglm"),
+            correlation(self.res_longley, algorithm="bglm"),
             self.result_abg,
         )
 
@@ -186,20 +158,11 @@ class TestCorrelation(BaseTester):
 
     def test_is_correlated_bglm(self) -> None:
         """Test is_correlated with Breusch-Godfrey algorithm."""
-        y = sm.datasets.longley.load_pandas().endog
-        X = sm.datasets.longley.load_pandas().exog
-        X = sm.add_constant(X)
-        res_ols = sm.OLS(y, X).fit()
-        res = is_correlated(res_ols, algorithm="bg")
+        res = is_correlated(self.res_longley, algorithm="bg")
         assert isinstance(res, dict)
         assert "result" in res
         assert res["algorithm"] == "bg"
 
-    def test_is_correlated_raises(self) -> None:
-        """Test is_correlated raises ValueError for unsupported algorithms."""
-        with raises(ValueError, match="is not supported for 'is_correlated'"):
-            is_correlated(self.data_airline, algorithm="acf")
-
     def test_is_correlated_logic(self) -> None:
         """Test correlation logic (correlated vs non-correlated)."""
         # Correlated
@@ -210,3 +173,19 @@ class TestCorrelation(BaseTester):
         res_noise = is_correlated(self.data_noise, algorithm="lb", lags=[10])
         # It's noise, so it should be False (stationary/non-correlated)
         assert isinstance(res_noise["result"], bool)
+
+
+class TestCorrelationErrors(BaseTester):
+
+    def test_correlation_raises(self) -> None:
+        with raises(ValueError):
+            correlation(x=self.data_airline, algorithm="xxxx")
+
+    def test_correlation_ccf_raises(self) -> None:
+        with raises(ValueError):
+            correlation(x=self.data_airline, algorithm="ccf")
+
+    def test_is_correlated_raises(self) -> None:
+        """Test is_correlated raises ValueError for unsupported algorithms."""
+        with raises(ValueError, match="is not supported for 'is_correlated'"):
+            is_correlated(self.data_airline, algorithm="acf")
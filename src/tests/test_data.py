@@ -54,21 +54,23 @@ class TestData(BaseTester):
 
     def test_load_airline_type_error(self) -> None:
         mock_df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
-        load_airline.cache_clear()
+        # Call the uncached function, so the shared cache is left intact
         with patch("pandas.read_csv", return_value=mock_df):
             with raises(TypeError, match="Expected a pandas Series from the data source."):
-                load_airline()
-        load_airline.cache_clear()
+                load_airline.__wrapped__()
 
     def test_load_macrodata_type_error(self) -> None:
-        load_macrodata.cache_clear()
+        # Call the uncached function, so the shared cache is left intact
         with patch("pandas.read_csv", return_value=pd.Series(dtype=float)):
             with raises(TypeCheckError) as e:
-                load_macrodata()
+                load_macrodata.__wrapped__()
             assert "value assigned to data (pandas.core.series.Series)" in str(e.value)
             assert "is not an instance of" in str(e.value)
             assert "pandas.core.frame.DataFrame" in str(e.value)
-        load_macrodata.cache_clear()
+
+    def test_load_airline_cached(self) -> None:
+        assert load_airline() is load_airline()
+        assert load_airline.cache_info().currsize == 1
 
     def test_get_uniform_data(self) -> None:
         res = get_uniform_data(42)
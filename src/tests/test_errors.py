@@ -14,6 +14,7 @@
 import unittest
 
 # ## Python Third Party Imports ----
+import numpy as np
 from pytest import raises
 
 # ## Local First Party Imports ----
@@ -74,6 +75,13 @@ class TestErrors(unittest.TestCase):
     def test_is_almost_equal_with_delta(self) -> None:
         assert is_almost_equal(1.0, 1.05, delta=0.1) is True
         assert is_almost_equal(1.0, 1.2, delta=0.1) is False
+        assert is_almost_equal(1.0, 1.5, delta=0.5) is True
+        assert is_almost_equal(1.0, float("inf"), delta=0.1) is False
+        assert is_almost_equal(1.0, 1.05, delta=-0.1) is False
+
+    def test_is_almost_equal_numpy_scalars(self) -> None:
+        assert is_almost_equal(np.float64(1.0), np.float64(1.05), delta=0.1) is True
+        assert is_almost_equal(np.float64(1.0), np.float64(1.1), places=3) is False
 
     def test_assert_almost_equal_failures_1(self) -> None:
         with raises(AssertionError) as e:
@@ -16,10 +16,12 @@ import unittest
 # ## Python Third Party Imports ----
 import numpy as np
 import statsmodels.api as sm
+from parameterized import parameterized
 from pytest import raises
 from statsmodels.stats.diagnostic import ResultsStore
 
 # ## Local First Party Imports ----
+from tests.setup import name_func_predefined_name
 from ts_stat_tests.heteroscedasticity import (
     arch,
     bpl,
@@ -40,33 +42,35 @@ from ts_stat_tests.heteroscedasticity import (
 class TestHeteroscedasticity(unittest.TestCase):
     """Unit tests for heteroscedasticity algorithms and dispatcher."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.rng = np.random.default_rng(42)
-        self.n_obs = 100
-        self.x = sm.add_constant(np.linspace(1, 10, self.n_obs))
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test data, shared (read-only) by all tests in the class."""
+        super().setUpClass()
+        cls.rng = np.random.default_rng(42)
+        cls.n_obs = 100
+        cls.x = sm.add_constant(np.linspace(1, 10, cls.n_obs))
 
         # Homoscedastic data
-        self.y_homo = 2 * self.x[:, 1] + self.rng.normal(scale=1.0, size=self.n_obs)
-        self.res_homo = sm.OLS(self.y_homo, self.x).fit()
+        cls.y_homo = 2 * cls.x[:, 1] + cls.rng.normal(scale=1.0, size=cls.n_obs)
+        cls.res_homo = sm.OLS(cls.y_homo, cls.x).fit()
 
         # Heteroscedastic data (variance increases with x)
-        self.y_het = 2 * self.x[:, 1] + self.rng.normal(scale=0.5 * self.x[:, 1], size=self.n_obs)
-        self.res_het = sm.OLS(self.y_het, self.x).fit()
+        cls.y_het = 2 * cls.x[:, 1] + cls.rng.normal(scale=0.5 * cls.x[:, 1], size=cls.n_obs)
+        cls.res_het = sm.OLS(cls.y_het, cls.x).fit()
 
         # ARCH data (volatility clustering)
         # e_t = sigma_t * epsilon_t, sigma_t^2 = alpha_0 + alpha_1 * e_{t-1}^2
         # Use a simple ARCH(1) process
-        arch_errors = np.zeros(self.n_obs)
-        sigma2 = np.zeros(self.n_obs)
-        epsilon = self.rng.normal(size=self.n_obs)
+        arch_errors = np.zeros(cls.n_obs)
+        sigma2 = np.zeros(cls.n_obs)
+        epsilon = cls.rng.normal(size=cls.n_obs)
         sigma2[0] = 1.0
         arch_errors[0] = np.sqrt(sigma2[0]) * epsilon[0]
-        for t in range(1, self.n_obs):
+        for t in range(1, cls.n_obs):
             sigma2[t] = 0.5 + 0.8 * arch_errors[t - 1] ** 2
             arch_errors[t] = np.sqrt(sigma2[t]) * epsilon[t]
-        self.y_arch = 2 * self.x[:, 1] + arch_errors
-        self.res_arch = sm.OLS(self.y_arch, self.x).fit()
+        cls.y_arch = 2 * cls.x[:, 1] + arch_errors
+        cls.res_arch = sm.OLS(cls.y_arch, cls.x).fit()
 
     # ## Algorithm Tests ----
 
@@ -150,10 +154,13 @@ class TestHeteroscedasticity(unittest.TestCase):
         res_gq_store = is_heteroscedastic(self.res_het, algorithm="gq", store=True)
         assert isinstance(res_gq_store["result"], bool)
 
-    def test_is_heteroscedastic_all_algs(self) -> None:
+    @parameterized.expand(
+        [("arch",), ("bp",), ("gq",), ("white",)],
+        name_func=name_func_predefined_name,
+    )
+    def test_is_heteroscedastic_all_algs(self, alg) -> None:
         """Test is_heteroscedastic with all algorithms."""
-        for alg in ["arch", "bp", "gq", "white"]:
-            res = is_heteroscedastic(self.res_homo, algorithm=alg)
-            assert res["algorithm"] == alg
-            assert "result" in res
-            assert "pvalue" in res
+        res = is_heteroscedastic(self.res_homo, algorithm=alg)
+        assert res["algorithm"] == alg
+        assert "result" in res
+        assert "pvalue" in res
@@ -24,10 +24,12 @@ import unittest
 # ## Python Third Party Imports ----
 import numpy as np
 import statsmodels.api as sm
+from parameterized import parameterized
 from pytest import raises
 from statsmodels.stats.contrast import ContrastResults
 
 # ## Local First Party Imports ----
+from tests.setup import name_func_predefined_name
 from ts_stat_tests.linearity import hc, is_linear, linearity, lm, rb, rr
 
 
@@ -41,17 +43,19 @@ from ts_stat_tests.linearity import hc, is_linear, linearity, lm, rb, rr
 class TestLinearity(unittest.TestCase):
     """Unit tests for linearity algorithms and dispatcher."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.rng = np.random.default_rng(42)
-        self.x = sm.add_constant(np.linspace(0, 10, 100))
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up test data, shared (read-only) by all tests in the class."""
+        super().setUpClass()
+        cls.rng = np.random.default_rng(42)
+        cls.x = sm.add_constant(np.linspace(0, 10, 100))
         # Linear relationship
-        self.y_linear = 3 + 2 * self.x[:, 1] + self.rng.normal(size=100)
+        cls.y_linear = 3 + 2 * cls.x[:, 1] + cls.rng.normal(size=100)
         # Non-linear relationship (quadratic)
-        self.y_nonlinear = 3 + 2 * self.x[:, 1] + 0.5 * self.x[:, 1] ** 2 + self.rng.normal(size=100)
+        cls.y_nonlinear = 3 + 2 * cls.x[:, 1] + 0.5 * cls.x[:, 1] ** 2 + cls.rng.normal(size=100)
 
-        self.res_linear = sm.OLS(self.y_linear, self.x).fit()
-        self.res_nonlinear = sm.OLS(self.y_nonlinear, self.x).fit()
+        cls.res_linear = sm.OLS(cls.y_linear, cls.x).fit()
+        cls.res_nonlinear = sm.OLS(cls.y_nonlinear, cls.x).fit()
 
     # ## Algorithm Tests ----
 
@@ -96,7 +100,8 @@ class TestLinearity(unittest.TestCase):
         """Test Rainbow test with different parameters."""
         # Use data without constant for use_distance=True to avoid singular matrix
         x_no_const = np.linspace(0, 10, 100).reshape(-1, 1)
-        y = 3 + 2 * x_no_const.flatten() + self.rng.normal(size=100)
+        rng = np.random.default_rng(42)
+        y = 3 + 2 * x_no_const.flatten() + rng.normal(size=100)
         res = sm.OLS(y, x_no_const).fit()
         stat, pval = rb(res, frac=0.4, use_distance=True)
         assert isinstance(stat, float)
@@ -150,9 +155,12 @@ class TestLinearity(unittest.TestCase):
         # RESET is good at picking up quadratic
         assert res_nl["result"] is False
 
-    def test_is_linear_all_algorithms(self) -> None:
+    @parameterized.expand(
+        [("hc",), ("lm",), ("rb",), ("rr",)],
+        name_func=name_func_predefined_name,
+    )
+    def test_is_linear_all_algorithms(self, alg) -> None:
         """Test is_linear with all supported algorithms."""
-        for alg in ["hc", "lm", "rb", "rr"]:
-            res = is_linear(self.res_linear, algorithm=alg)
-            assert isinstance(res["result"], bool)
-            assert res["algorithm"] == alg
+        res = is_linear(self.res_linear, algorithm=alg)
+        assert isinstance(res["result"], bool)
+        assert res["algorithm"] == alg
@@ -15,10 +15,11 @@ from unittest.mock import patch
 
 # ## Python Third Party Imports ----
 import numpy as np
+from parameterized import parameterized
 from pytest import raises
 
 # ## Local First Party Imports ----
-from tests.setup import BaseTester
+from tests.setup import BaseTester, name_func_predefined_name
 from ts_stat_tests.normality import ad, dp, is_normal, jb, normality, ob, sw
 from ts_stat_tests.utils.errors import assert_almost_equal
 
@@ -41,13 +42,13 @@ class TestNormality(BaseTester):
         cls.data_non_normal = rng.exponential(1, 100)
 
         cls.result_jb = is_normal(x=cls.data_normal, algorithm="jb")
-        cls.result_ob = is_normal(x=cls.data_normal, algorithm="ob")
         cls.result_sw = is_normal(x=cls.data_normal, algorithm="sw")
         cls.result_dp = is_normal(x=cls.data_normal, algorithm="dp")
         cls.result_ad = is_normal(x=cls.data_normal, algorithm="ad")
 
     def test_normality_keys(self) -> None:
         assert set(self.result_dp.keys()) >= {"result", "statistic", "p_value", "alpha"}
+        assert set(self.result_jb.keys()) >= {"result", "statistic", "p_value", "alpha"}
 
     def test_normality_ad_keys(self) -> None:
         assert set(self.result_ad.keys()) >= {"result", "statistic", "critical_value", "significance_level", "alpha"}
@@ -65,10 +66,20 @@ class TestNormality(BaseTester):
         res_non_normal = is_normal(x=self.data_non_normal, algorithm="sw")
         assert res_non_normal["result"] is False
 
-    def test_normality_dispatch(self) -> None:
+    @parameterized.expand(
+        [
+            ("jarque-bera", jb),
+            ("omnibus", ob),
+            ("shapiro-wilk", sw),
+            ("dagostino-pearson", dp),
+            ("anderson-darling", ad),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_normality_dispatch(self, algorithm, func) -> None:
         # Check that dispatch works for different names
-        res1 = normality(self.data_normal, algorithm="jarque-bera")
-        res2 = jb(self.data_normal)
+        res1 = normality(self.data_normal, algorithm=algorithm)
+        res2 = func(self.data_normal)
         assert_almost_equal(res1[0], res2[0])
 
     def test_normality_errors(self) -> None:
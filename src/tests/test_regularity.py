@@ -230,6 +230,26 @@ class TestRegularity(BaseTester):
             places=4,
         )
 
+    def test_permutation_ties(self) -> None:
+        assert_almost_equal(
+            first=permutation_entropy(x=[1, 2, 2, 1, 3, 3, 2, 1, 1, 2, 2, 3], order=3, delay=2),
+            second=2.2500,
+            places=4,
+        )
+
+    def test_permutation_order_four(self) -> None:
+        assert_almost_equal(
+            first=permutation_entropy(x=self.data_random, order=4, normalize=True),
+            second=0.9962,
+            places=4,
+        )
+
+    def test_permutation_errors(self) -> None:
+        with raises(ValueError):
+            permutation_entropy(x=[1, 2, 3, 4], order=2, delay=3)
+        with raises(ValueError):
+            permutation_entropy(x=[1, 2, 3, 4, 5], order=3, delay=[1, 2])
+
     def test_spectral_basic(self) -> None:
         assert_almost_equal(
             first=spectral_entropy(x=self.data_airline, sf=12),
@@ -16,11 +16,12 @@ from unittest.mock import patch
 # ## Python Third Party Imports ----
 import numpy as np
 import pandas as pd
+from parameterized import parameterized
 from pmdarima.arima import ARIMA
 from pytest import raises
 
 # ## Local First Party Imports ----
-from tests.setup import BaseTester
+from tests.setup import BaseTester, name_func_predefined_name
 from ts_stat_tests.seasonality import (
     ch,
     is_seasonal,
@@ -70,35 +71,37 @@ class TestSeasonality(BaseTester):
         assert isinstance(self.result_qs_complex[1], float)
         assert isinstance(self.result_qs_complex[2], (dict, type(None), ARIMA))
 
-    def test_qs(self) -> None:
-
-        # To get the full list of necessary permutations, run:
-        # >>> import itertools
-        # >>> print(list(itertools.product(*[[True,False]]*3)))
-
-        params = [
-            (True, True, True, 101.8592939, 7.6126411e-23),
-            (True, True, False, 131.4499985, 2.8575608e-29),
-            (True, False, True, 194.4692892, 5.9092232e-43),
-            (True, False, False, 194.4692892, 5.9092232e-43),
-            (False, True, True, 132.5823829, 1.6221885e-29),
-            (False, True, False, 145.1209623, 3.0717326e-32),
-            (False, False, True, 141.7127876, 1.6883370e-31),
-            (False, False, False, 141.7127876, 1.6883370e-31),
-        ]
-
-        for diff, residuals, autoarima, expected_stat, expected_pval in params:
-            qs_result = qs(
-                x=self.data_airline,
-                freq=12,
-                diff=diff,
-                residuals=residuals,
-                autoarima=autoarima,
-            )
-            assert_almost_equal(qs_result[0], expected_stat, places=5)
-            assert_almost_equal(qs_result[1], expected_pval, places=5)
-            if residuals:
-                assert isinstance(qs_result[2], ARIMA)
+    # To get the full list of necessary permutations, run:
+    # >>> import itertools
+    # >>> print(list(itertools.product(*[[True,False]]*3)))
+    @parameterized.expand(
+        [
+            ("diff_resid_auto", True, True, True, 101.8592939, 7.6126411e-23),
+            ("diff_resid", True, True, False, 131.4499985, 2.8575608e-29),
+            ("diff_auto", True, False, True, 194.4692892, 5.9092232e-43),
+            ("diff", True, False, False, 194.4692892, 5.9092232e-43),
+            ("resid_auto", False, True, True, 132.5823829, 1.6221885e-29),
+            ("resid", False, True, False, 145.1209623, 3.0717326e-32),
+            ("auto", False, False, True, 141.7127876, 1.6883370e-31),
+            ("none", False, False, False, 141.7127876, 1.6883370e-31),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_qs(self, name, diff, residuals, autoarima, expected_stat, expected_pval) -> None:
+
+        # Reuse the auto-ARIMA model fitted in `setUpClass`, rather than refitting it for each permutation
+        qs_result = qs(
+            x=self.data_airline,
+            freq=12,
+            diff=diff,
+            residuals=residuals,
+            autoarima=autoarima,
+            model=self.result_qs_complex[2] if autoarima else None,
+        )
+        assert_almost_equal(qs_result[0], expected_stat, places=5)
+        assert_almost_equal(qs_result[1], expected_pval, places=5)
+        if residuals:
+            assert isinstance(qs_result[2], ARIMA)
 
     def test_qs_failures(self) -> None:
         with raises(AttributeError):
@@ -109,6 +112,8 @@ class TestSeasonality(BaseTester):
             qs(pd.Series([1, 1]), 12, True, True, False)
         with raises(ValueError):
             qs(pd.Series([0, 1]), 4, True, True, True)
+        with raises(ValueError):
+            qs(self.data_airline[:-1], 12, residuals=True, model=self.result_qs_complex[2])
 
     def test_ocsb(self) -> None:
         assert self.result_ocsb == 1
@@ -39,13 +39,15 @@ class TestStability(BaseTester):
         cls.result_is_stable = is_stable(cls.data_airline)
         cls.result_lumpiness = lumpiness(cls.data_airline)
         cls.result_is_lumpy = is_lumpy(cls.data_airline)
+        cls.expected_stability = ts_stability(cls.data_airline)["stability"]
+        cls.expected_lumpiness = ts_lumpiness(cls.data_airline)["lumpiness"]
 
     def setUp(self) -> None:
         pass
 
     def test_stability_1(self) -> None:
         result = self.result_stability
-        expected = ts_stability(self.data_airline)["stability"]
+        expected = self.expected_stability
         assert result == expected
 
     def test_stability_2(self) -> None:
@@ -55,7 +57,7 @@ class TestStability(BaseTester):
 
     def test_lumpiness_1(self) -> None:
         result = self.result_lumpiness
-        expected = ts_lumpiness(self.data_airline)["lumpiness"]
+        expected = self.expected_lumpiness
         assert result == expected
 
     def test_lumpiness_2(self) -> None:
@@ -20,6 +20,7 @@ from arch.unitroot import (
     PhillipsPerron as ar_pp,
     VarianceRatio as ar_vr,
 )
+from parameterized import parameterized
 from pytest import raises
 from statsmodels.tsa.stattools import (
     adfuller as sm_adf,
@@ -29,7 +30,7 @@ from statsmodels.tsa.stattools import (
 )
 
 # ## Local First Party Imports ----
-from tests.setup import BaseTester
+from tests.setup import BaseTester, name_func_predefined_name
 from ts_stat_tests.stationarity import (
     adf,
     ers,
@@ -60,9 +61,8 @@ class TestStationarity(BaseTester):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-
-    def setUp(self):
-        pass
+        # Seed for reproducibility
+        cls.data_normal = np.random.default_rng(42).normal(0, 1, 100)
 
     def test_stationarity(self) -> None:
         assert isinstance(stationarity(x=np.arange(100)), tuple)
@@ -80,15 +80,17 @@ class TestStationarity(BaseTester):
 
     def test_is_stationary_logic(self) -> None:
         """Test different H0 logic in is_stationary."""
-        data = np.random.normal(0, 1, 100)
 
-        # ADF (H0: unit root)
-        res_adf = is_stationary(data, algorithm="adf", alpha=0.05)
-        assert isinstance(res_adf["result"], bool)
+        with patch("ts_stat_tests.stationarity.tests.stationarity") as mock_stat:
+            mock_stat.return_value = (0.5, 0.01)
+
+            # ADF (H0: unit root), so a small p-value means stationary
+            res_adf = is_stationary(self.data_normal, algorithm="adf", alpha=0.05)
+            assert res_adf["result"] is True
 
-        # KPSS (H0: stationary)
-        res_kpss = is_stationary(data, algorithm="kpss", alpha=0.05)
-        assert isinstance(res_kpss["result"], bool)
+            # KPSS (H0: stationary), so a small p-value means non-stationary
+            res_kpss = is_stationary(self.data_normal, algorithm="kpss", alpha=0.05)
+            assert res_kpss["result"] is False
 
     def test_is_stationary_pvalue_bool_coverage(self) -> None:
         """Test branch coverage for pvalue_or_bool being a boolean."""
@@ -110,15 +112,14 @@ class TestStationarity(BaseTester):
             assert res["result"] is False
             assert res["pvalue"] is None
 
-    def test_stationarity_dispatcher_coverage(self) -> None:
+    @parameterized.expand(
+        [("adf",), ("kpss",), ("pp",), ("za",), ("ers",), ("vr",), ("rur",)],
+        name_func=name_func_predefined_name,
+    )
+    def test_stationarity_dispatcher_coverage(self, algorithm) -> None:
         """Test all algorithms in stationarity dispatcher for coverage."""
-        data = np.random.normal(0, 1, 100)
         # These are already covered or partially covered, but let's be explicit
-        stationarity(data, algorithm="pp")
-        stationarity(data, algorithm="za")
-        stationarity(data, algorithm="ers")
-        stationarity(data, algorithm="vr")
-        stationarity(data, algorithm="rur")
+        assert isinstance(stationarity(self.data_normal, algorithm=algorithm), tuple)
 
 
 class TestStationarityADF(BaseTester):
@@ -139,9 +140,6 @@ class TestStationarityADF(BaseTester):
         cls.result_sm_adf_basic = sm_adf(x=cls.data_basic)
         cls.result_sm_adf_noise = sm_adf(x=cls.data_noise)
 
-    def setUp(self):
-        pass
-
     def test_stationarity_adf_airline(self) -> None:
         assert self.result_adf_airline == self.result_sm_adf_airline
 
@@ -198,9 +196,6 @@ class TestStationarityKPSS(BaseTester):
         cls.result_sm_kpss_basic = sm_kpss(x=cls.data_basic)
         cls.result_sm_kpss_noise = sm_kpss(x=cls.data_noise)
 
-    def setUp(self):
-        pass
-
     def test_stationarity_kpss_airline(self) -> None:
         assert self.result_kpss_airline == self.result_sm_kpss_airline
 
@@ -238,9 +233,6 @@ class TestStationarityRUR(BaseTester):
         # cls.result_sm_rur_basic = sm_rur(x=cls.data_basic)
         # cls.result_sm_rur_noise = sm_rur(x=cls.data_noise)
 
-    def setUp(self):
-        pass
-
     def test_stationarity_rur_airline(self) -> None:
         assert self.result_rur_airline == self.result_sm_rur_airline
 
@@ -267,38 +259,28 @@ class TestStationarityZA(BaseTester):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.result_za_airline = za(x=cls.data_airline)
-        cls.result_za_random = za(x=cls.data_random)
+
+        def round_stats(res):
+            # Round the statistic and p-value, to allow for last-bit floating point differences
+            return (round(res[0], 7), round(res[1], 7), *res[2:])
+
+        cls.result_za_airline = round_stats(za(x=cls.data_airline))
+        cls.result_za_random = round_stats(za(x=cls.data_random))
         # cls.result_za_sine = za(x=cls.data_sine)
         # cls.result_za_line = za(x=cls.data_line)
         cls.result_za_basic = za(x=cls.data_basic)
-        cls.result_za_noise = za(x=cls.data_noise)
-        cls.result_sm_za_airline = sm_za(x=cls.data_airline)
-        cls.result_sm_za_random = sm_za(x=cls.data_random)
+        cls.result_za_noise = round_stats(za(x=cls.data_noise))
+        cls.result_sm_za_airline = round_stats(sm_za(x=cls.data_airline))
+        cls.result_sm_za_random = round_stats(sm_za(x=cls.data_random))
         # cls.result_sm_za_sine = sm_za(x=cls.data_sine)
         # cls.result_sm_za_line = sm_za(x=cls.data_line)
         cls.result_sm_za_basic = sm_za(x=cls.data_basic)
-        cls.result_sm_za_noise = sm_za(x=cls.data_noise)
-
-    def setUp(self):
-        pass
+        cls.result_sm_za_noise = round_stats(sm_za(x=cls.data_noise))
 
     def test_stationarity_za_airline(self) -> None:
-        self.result_za_airline = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_za_airline)
-        )
-        self.result_sm_za_airline = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_sm_za_airline)
-        )
         assert self.result_za_airline == self.result_sm_za_airline
 
     def test_stationarity_za_random(self) -> None:
-        self.result_za_random = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_za_random)
-        )
-        self.result_sm_za_random = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_sm_za_random)
-        )
         assert self.result_za_random == self.result_sm_za_random
 
     def test_stationarity_za_sine(self) -> None:
@@ -313,12 +295,6 @@ class TestStationarityZA(BaseTester):
         assert self.result_za_basic == self.result_sm_za_basic
 
     def test_stationarity_za_noise(self) -> None:
-        self.result_za_noise = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_za_noise)
-        )
-        self.result_sm_za_noise = tuple(
-            round(elem, 7) if index <= 1 else elem for index, elem in enumerate(self.result_sm_za_noise)
-        )
         assert self.result_za_noise == self.result_sm_za_noise
 
 
@@ -336,22 +312,20 @@ class TestStationarityPP(BaseTester):
             res = ar_pp(y, lags=lags)
             return (float(res.stat), float(res.pvalue), int(res.lags), dict(res.critical_values))
 
+        data_basic = np.array(cls.data_basic)
         cls.result_pp_airline = pp(x=cls.data_airline)
         cls.result_pp_random = pp(x=cls.data_random)
         cls.result_pp_sine = pp(x=cls.data_sine)
         cls.result_pp_line = pp(x=cls.data_line)
-        cls.result_pp_basic = pp(x=np.array(cls.data_basic))
+        cls.result_pp_basic = pp(x=data_basic)
         cls.result_pp_noise = pp(x=cls.data_noise)
         cls.result_pa_pp_airline = get_ar_pp_res(cls.data_airline)
         cls.result_pa_pp_random = get_ar_pp_res(cls.data_random)
         cls.result_pa_pp_sine = get_ar_pp_res(cls.data_sine)
         cls.result_pa_pp_line = get_ar_pp_res(cls.data_line)
-        cls.result_pa_pp_basic = get_ar_pp_res(np.array(cls.data_basic))
+        cls.result_pa_pp_basic = get_ar_pp_res(data_basic)
         cls.result_pa_pp_noise = get_ar_pp_res(cls.data_noise)
 
-    def setUp(self):
-        pass
-
     def test_stationarity_pp_airline(self) -> None:
         assert self.result_pp_airline == self.result_pa_pp_airline
 
@@ -376,47 +350,23 @@ class TestStationarityERS(BaseTester):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+
+        def get_ar_ers_res(y):
+            res = ar_ers(y=y)
+            return (float(res.stat), float(res.pvalue), int(res.lags), dict(res.critical_values))
+
         cls.result_ers_airline = ers(y=cls.data_airline)
         cls.result_ers_random = ers(y=cls.data_random)
         # cls.result_ers_sine = ers(y=cls.data_sine)
         # cls.result_ers_line = ers(y=cls.data_line)
         cls.result_ers_basic = ers(y=cls.data_basic)
         cls.result_ers_noise = ers(y=cls.data_noise)
-        ar_ers_airline = ar_ers(y=cls.data_airline)
-        cls.result_ar_ers_airline = (
-            float(ar_ers_airline.stat),
-            float(ar_ers_airline.pvalue),
-            int(ar_ers_airline.lags),
-            dict(ar_ers_airline.critical_values),
-        )
-        ar_ers_random = ar_ers(y=cls.data_random)
-        cls.result_ar_ers_random = (
-            float(ar_ers_random.stat),
-            float(ar_ers_random.pvalue),
-            int(ar_ers_random.lags),
-            dict(ar_ers_random.critical_values),
-        )
-        # ar_ers_sine = ar_ers(y=cls.data_sine)
-        # cls.result_ar_ers_sine = (float(ar_ers_sine.stat), float(ar_ers_sine.pvalue), int(ar_ers_sine.lags), dict(ar_ers_sine.critical_values))
-        # ar_ers_line = ar_ers(y=cls.data_line)
-        # cls.result_ar_ers_line = (float(ar_ers_line.stat), float(ar_ers_line.pvalue), int(ar_ers_line.lags), dict(ar_ers_line.critical_values))
-        ar_ers_basic = ar_ers(y=cls.data_basic)
-        cls.result_ar_ers_basic = (
-            float(ar_ers_basic.stat),
-            float(ar_ers_basic.pvalue),
-            int(ar_ers_basic.lags),
-            dict(ar_ers_basic.critical_values),
-        )
-        ar_ers_noise = ar_ers(y=cls.data_noise)
-        cls.result_ar_ers_noise = (
-            float(ar_ers_noise.stat),
-            float(ar_ers_noise.pvalue),
-            int(ar_ers_noise.lags),
-            dict(ar_ers_noise.critical_values),
-        )
-
-    def setUp(self):
-        pass
+        cls.result_ar_ers_airline = get_ar_ers_res(cls.data_airline)
+        cls.result_ar_ers_random = get_ar_ers_res(cls.data_random)
+        # cls.result_ar_ers_sine = get_ar_ers_res(cls.data_sine)
+        # cls.result_ar_ers_line = get_ar_ers_res(cls.data_line)
+        cls.result_ar_ers_basic = get_ar_ers_res(cls.data_basic)
+        cls.result_ar_ers_noise = get_ar_ers_res(cls.data_noise)
 
     def test_stationarity_ers_airline(self) -> None:
         assert self.result_ers_airline == self.result_ar_ers_airline
@@ -444,35 +394,23 @@ class TestStationarityVR(BaseTester):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+
+        def get_ar_vr_res(y):
+            res = ar_vr(y=y)
+            return (float(res.stat), float(res.pvalue), float(res.vr))
+
         cls.result_vr_airline = vr(y=cls.data_airline)
         cls.result_vr_random = vr(y=cls.data_random)
         cls.result_vr_sine = vr(y=cls.data_sine)
         cls.result_vr_line = vr(y=cls.data_line)
         cls.result_vr_basic = vr(y=cls.data_basic)
         cls.result_vr_noise = vr(y=cls.data_noise)
-        ar_vr_airline = ar_vr(y=cls.data_airline)
-        cls.result_ar_vr_airline = (
-            float(ar_vr_airline.stat),
-            float(ar_vr_airline.pvalue),
-            float(ar_vr_airline.vr),
-        )
-        ar_vr_random = ar_vr(y=cls.data_random)
-        cls.result_ar_vr_random = (
-            float(ar_vr_random.stat),
-            float(ar_vr_random.pvalue),
-            float(ar_vr_random.vr),
-        )
-        ar_vr_sine = ar_vr(y=cls.data_sine)
-        cls.result_ar_vr_sine = (float(ar_vr_sine.stat), float(ar_vr_sine.pvalue), float(ar_vr_sine.vr))
-        ar_vr_line = ar_vr(y=cls.data_line)
-        cls.result_ar_vr_line = (float(ar_vr_line.stat), float(ar_vr_line.pvalue), float(ar_vr_line.vr))
-        ar_vr_basic = ar_vr(y=cls.data_basic)
-        cls.result_ar_vr_basic = (float(ar_vr_basic.stat), float(ar_vr_basic.pvalue), float(ar_vr_basic.vr))
-        ar_vr_noise = ar_vr(y=cls.data_noise)
-        cls.result_ar_vr_noise = (float(ar_vr_noise.stat), float(ar_vr_noise.pvalue), float(ar_vr_noise.vr))
-
-    def setUp(self):
-        pass
+        cls.result_ar_vr_airline = get_ar_vr_res(cls.data_airline)
+        cls.result_ar_vr_random = get_ar_vr_res(cls.data_random)
+        cls.result_ar_vr_sine = get_ar_vr_res(cls.data_sine)
+        cls.result_ar_vr_line = get_ar_vr_res(cls.data_line)
+        cls.result_ar_vr_basic = get_ar_vr_res(cls.data_basic)
+        cls.result_ar_vr_noise = get_ar_vr_res(cls.data_noise)
 
     def test_stationarity_vr_airline(self) -> None:
         assert self.result_vr_airline == self.result_ar_vr_airline
@@ -37,6 +37,7 @@
 
 
 # ## Python StdLib Imports ----
+from math import factorial
 from typing import Literal, Optional, Union
 
 # ## Python Third Party Imports ----
@@ -79,6 +80,66 @@ VALID_KDTREE_METRIC_OPTIONS = Literal[
 VALID_SPECTRAL_ENTROPY_METHOD_OPTIONS = Literal["fft", "welch"]
 
 
+## --------------------------------------------------------------------------- #
+##  Helpers                                                                 ####
+## --------------------------------------------------------------------------- #
+
+
+def _perm_entropy_pairwise(x: NDArray[np.float64], order: int, delay: int, normalize: bool) -> float:
+    r"""
+    !!! note "Summary"
+        Permutation entropy from pairwise comparisons of the delayed series, without sorting each window.
+
+    ???+ abstract "Details"
+        Each window is encoded by one bit per pair of positions $(i, j)$ with $i < j$, set when $x_i \le x_j$.
+        For a total order these bits identify the ordinal pattern uniquely, with ties broken by position, as a stable argsort would.
+        Only sensible for small `order`, since there are $\text{order} \times (\text{order} - 1) / 2$ bits per window.
+
+    Params:
+        x (NDArray[np.float64]):
+            One-dimensional time series of shape `(n_times,)`.
+        order (int):
+            Order of permutation entropy.
+        delay (int):
+            Time delay (lag).
+        normalize (bool):
+            If `True`, divide by $\log_2(\text{order}!)$ to normalize the entropy between $0$ and $1$.
+
+    Returns:
+        (float):
+            The permutation entropy of the data set.
+
+    ???+ example "Examples"
+
+        ```pycon {.py .python linenums="1" title="Setup"}
+        >>> import numpy as np
+        >>> from ts_stat_tests.regularity.algorithms import _perm_entropy_pairwise
+        >>> x = np.array([1.0, 2.0, 2.0, 1.0, 3.0, 3.0, 2.0, 1.0])
+
+        ```
+
+        ```pycon {.py .python linenums="1" title="Example 1: Tied Data (Normalized)"}
+        >>> print(f"{_perm_entropy_pairwise(x, order=3, delay=1, normalize=True):.4f}")
+        0.7421
+
+        ```
+    """
+    n: int = x.size - (order - 1) * delay
+    cols: list[NDArray[np.float64]] = [x[i * delay : i * delay + n] for i in range(order)]
+    codes: NDArray[np.intp] = np.zeros(n, dtype=np.intp)
+    bit: int = 0
+    for i in range(order):
+        for j in range(i + 1, order):
+            codes |= (cols[i] <= cols[j]).astype(np.intp) << bit
+            bit += 1
+    counts: NDArray[np.intp] = np.bincount(codes)
+    p: NDArray[np.float64] = counts[counts > 0] / n
+    pe: float = -np.sum(p * np.log2(p))
+    if normalize:
+        pe /= np.log2(factorial(order))
+    return pe
+
+
 # ---------------------------------------------------------------------------- #
 #                                                                              #
 #    Algorithms                                                             ####
@@ -320,6 +381,8 @@ def permutation_entropy(
 
         Choosing an appropriate embedding dimension is crucial in ensuring that the permutation entropy calculation is robust and reliable, and captures the essential features of the time series in a meaningful way.
 
+        For `order` of $2$ or $3$, the ordinal patterns are counted directly from pairwise comparisons of the delayed series rather than by sorting every window. This gives the same result as `antropy`, with ties broken by position.
+
     Params:
         x (ArrayLike):
             One-dimensional time series of shape `(n_times,)`.
@@ -395,6 +458,13 @@ def permutation_entropy(
         - [`antropy.sample_entropy`](https://raphaelvallat.com/antropy/build/html/generated/antropy.sample_entropy.html)
         - [`antropy.spectral_entropy`](https://raphaelvallat.com/antropy/build/html/generated/antropy.spectral_entropy.html)
     """
+    if order in (2, 3):
+        arr: NDArray[np.float64] = np.asarray(x, dtype=np.float64)
+        delays: list[int] = [delay] if isinstance(delay, int) else [int(d) for d in delay]
+        if arr.ndim == 1 and len(delays) > 0 and min(delays) > 0 and order * max(delays) <= arr.size:
+            return float(
+                np.mean([_perm_entropy_pairwise(arr, order=order, delay=d, normalize=normalize) for d in delays])
+            )
     return a_perm_entropy(
         x=x,
         order=order,
@@ -81,6 +81,7 @@ def qs(
     diff: bool = True,
     residuals: bool = False,
     autoarima: bool = True,
+    model: Optional[ARIMA] = None,
 ) -> Union[tuple[float, float], tuple[float, float, Optional[ARIMA]]]:
     r"""
     !!! note "Summary"
@@ -88,7 +89,7 @@ def qs(
 
     ???+ abstract "Details"
 
-        If `residuals=False` the `autoarima` settings are ignored.
+        If `residuals=False` the `autoarima` and `model` settings are ignored.
 
         If `residuals=True`, a non-seasonal ARIMA model is estimated for the time series. And the residuals of the fitted model are used as input to the test statistic. If an automatic order selection is used, the Hyndman-Khandakar algorithm is employed with: $\max(p)=\max(q)<=3$.
 
@@ -121,12 +122,17 @@ def qs(
         autoarima (bool, optional):
             Whether or not to run the `AutoARIMA()` algorithm over the data.<br>
             Default: `True`
+        model (Optional[ARIMA], optional):
+            An ARIMA model already fitted to `x`. If given and `residuals=True`, its residuals are used directly and no model is estimated, so `autoarima` is ignored. Useful when running several variants of the test on the same data.<br>
+            Default: `None`
 
     Raises:
         (AttributeError):
             If `x` is empty, or `freq` is too low for the data to be adequately tested.
         (ValueError):
             If, after differencing the data (by using `np.diff()`), any of the values are `None` (or `Null` or `np.nan`), then it cannot be used for QS Testing.
+        (ValueError):
+            If `model` is given and its residuals are not the same length as `x`.
 
     Returns:
         (Union[tuple[float, float], tuple[float, float, Optional[ARIMA]]]):
@@ -201,10 +207,14 @@ def qs(
     if freq < 2:
         raise AttributeError(f"The number of observations per cycle is '{freq}', which is too small.")
 
-    model: Optional[ARIMA] = None
-
     if residuals:
-        if autoarima:
+        if model is not None:
+            if len(model.resid()) != len(_x):
+                raise ValueError(
+                    f"The residuals of the given `model` have length '{len(model.resid())}', "
+                    f"but `x` has length '{len(_x)}'."
+                )
+        elif autoarima:
             max_order: int = 1 if freq < 8 else 3
             allow_drift: bool = True if freq < 8 else False
             try:
@@ -224,15 +234,13 @@ def qs(
                     model = ARIMA(order=(0, 1, 1)).fit(y=_x)
                 except (ValueError, RuntimeError, IndexError):
                     print("Could not estimate any ARIMA model, original data series is used.")
-            if model is not None:
-                _x = model.resid()
         else:
             try:
                 model = ARIMA(order=(0, 1, 1)).fit(y=_x)
             except (ValueError, RuntimeError, IndexError):
                 print("Could not estimate any ARIMA model, original data series is used.")
-            if model is not None:
-                _x = model.resid()
+        if model is not None:
+            _x = model.resid()
 
     # Do diff
     y: NDArray[np.float64] = np.diff(_x) if diff else _x
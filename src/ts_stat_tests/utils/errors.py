@@ -201,13 +201,8 @@ def is_almost_equal(
         return True
     diff: float = abs(first - second)
     if delta is not None:
-        if diff <= delta:
-            return True
-    else:
-        places_val: int = places if places is not None else 7
-        if round(diff, places_val) == 0:
-            return True
-    return False
+        return bool(diff <= delta)
+    return bool(round(diff, 7 if places is None else places) == 0)
 
 
 @overload
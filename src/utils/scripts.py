@@ -268,7 +268,7 @@ def check_mkdocs() -> None:
 def check_pytest() -> None:
     print_label("Check `pytest` to ensure all unit tests pass.")
     run(
-        "pytest --config-file=pyproject.toml",
+        "pytest --config-file=pyproject.toml --numprocesses=auto --dist=loadscope",
         *[file for file in get_all_files(".py") if DIRECTORY_NAME in file or "tests/test_" in file],
     )
 